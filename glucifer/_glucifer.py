@@ -12,17 +12,11 @@ import underworld as uw
 import errno
 import underworld._stgermain as _stgermain
 import os
-import urllib2
-import time
 import json
-from base64 import b64encode
 import libUnderworld
-import subprocess
-from subprocess import Popen, PIPE, STDOUT
 from . import objects
 import libUnderworld as _libUnderworld
 import sys
-import os
 from mpi4py import MPI
 
 #Attempt to import lavavu module
@@ -42,7 +36,7 @@ try:
 except:
     tmpdir = "/tmp"
 
-os.path.join(tmpdir,"glucifer")
+tmpdir = os.path.join(tmpdir,"glucifer")
 
 try:
     os.makedirs(tmpdir)
@@ -111,6 +105,7 @@ class Store(_stgermain.StgCompoundComponent):
             filename += ".gldb"
         self.filename = filename
         self._objects = []
+        self._object_ids = set()
         #Don't split on timestep unless filename provided
         if not self.filename: split = False
         self._split = split
@@ -134,7 +129,7 @@ class Store(_stgermain.StgCompoundComponent):
 
         componentDictionary[self._db.name].update( {
                             "filename"          :filename,
-                            "splitTransactions" :True,
+                            "splitTransactions" :False,
                             "singleFile"        :not self._split,
                             "compressed"        :self.compress,
         } )
@@ -176,55 +171,70 @@ class Store(_stgermain.StgCompoundComponent):
     def _generate(self, figname, objects, props):
         #First merge object list with active
         starttime = MPI.Wtime()
+        #(nested colourbars are collected separately rather than appended to
+        # the list being iterated over)
+        colourbars = []
         for obj in objects:
-            #Add nested colourbar objects
-            if obj._colourBar:
-                objects.append(obj._colourBar)
-                obj._colourBar.parent = obj #Save parent ref
-
             #Set default parent flag
             obj.parent = None
 
-            #Add to stored object list if not present
-            if obj not in self._objects:
-                self._objects.append(obj)
+            #Collect nested colourbar objects
+            if obj._colourBar:
+                colourbars.append((obj._colourBar, obj))
 
-        #Set default names on objects where omitted by user
-        #Needs to be updated every time as indices may have changed
-        for o in range(len(self._objects)):
-            #Default name + idx if no user set name
-            obj = self._objects[o]
-            if not "name" in obj.properties:
-                if obj.properties.get("colourbar"):
-                   obj.properties["name"] = 'ColourBar_' + str(o)
-                else:
-                   obj.properties["name"] = obj._dr.type[3:] + '_' + str(o)
+        #Add nested colourbar objects
+        for colourbar, parent in colourbars:
+            colourbar.parent = parent #Save parent ref
+            objects.append(colourbar)
+
+        #Add to stored object list if not present
+        for obj in objects:
+            if id(obj) not in self._object_ids:
+                #Set default name + idx where omitted by user
+                #(indices of stored objects only change when the store is emptied,
+                # so this only needs doing when an object is first added)
+                if not "name" in obj.properties:
+                    idx = str(len(self._objects))
+                    if obj.properties.get("colourbar"):
+                       obj.properties["name"] = 'ColourBar_' + idx
+                    else:
+                       obj.properties["name"] = obj._dr.type[3:] + '_' + idx
+                self._objects.append(obj)
+                self._object_ids.add(id(obj))
 
         #Set the write step
         self._db.timeStep = self.step
 
-        #Delete all drawing objects in register
-        for ii in range(self._db.drawingObjects.objects.count,0,-1):
-            libUnderworld.StGermain._Stg_ObjectList_RemoveByIndex(self._db.drawingObjects.objects,ii-1, libUnderworld.StGermain.KEEP)
+        #Clear all drawing objects in register (objects are kept, list is just reset)
+        self._db.drawingObjects.objects.count = 0
 
-        #Add drawing objects to register and output any custom data on them
+        #Update visibility and properties of all stored objects
+        active_ids = set(id(obj) for obj in objects)
         for obj in self._objects:
             #Hide objects not in this figure (also check parent for colour bars)
-            obj.properties["visible"] = bool(obj in objects or obj.parent and obj.parent in objects)
+            obj.properties["visible"] = id(obj) in active_ids or (obj.parent is not None and id(obj.parent) in active_ids)
 
             #Ensure properties updated before object written to db
             _libUnderworld.gLucifer.lucDrawingObject_SetProperties(obj._dr, obj._getProperties());
             if obj.colourMap:
                 _libUnderworld.gLucifer.lucColourMap_SetProperties(obj.colourMap._cm, obj.colourMap._getProperties());
 
-            #Add the object to the drawing object register for the database
-            libUnderworld.StGermain.Stg_ObjectList_Append(self._db.drawingObjects.objects,obj._cself)
+        #Add the objects to the drawing object register for the database
+        libUnderworld.StGermain.Stg_ObjectList_AppendArray(self._db.drawingObjects.objects, [obj._cself for obj in self._objects])
 
-        # go ahead and fill db
-        libUnderworld.gLucifer._lucDatabase_Execute(self._db,None)
+        #Get visualisation state as json data (before the transaction is opened)
+        state = self._get_state(self._objects, props)
 
-        #Write visualisation state as json data
-        libUnderworld.gLucifer.lucDatabase_WriteState(self._db, figname, self._get_state(self._objects, props))
+        # go ahead and fill db
+        # (all output for this step is a single transaction, the database
+        #  falls back to per-object transactions if it can't get a lock)
+        self._db.splitTransactions = False
+        try:
+            libUnderworld.gLucifer._lucDatabase_Execute(self._db,None)
+            libUnderworld.gLucifer.lucDatabase_WriteState(self._db, figname, state)
+        finally:
+            #Commit the timestep transaction, even on error, so it is never left open
+            libUnderworld.gLucifer.lucDatabase_Dump(self._db)
 
         #Output any custom geometry on objects
         if lavavu and uw.rank() == 0 and any(x.geomType is not None for x in self._objects):
@@ -260,20 +270,18 @@ class Store(_stgermain.StgCompoundComponent):
 
     def _get_state(self, objects, props):
         #Get current state as string for export
-        export = dict()
-        #Global properties passed from figure
-        export["properties"] = props
-        #View properties passed from figure
-        export["views"] = [props] #[viewprops]
-        #Objects passed from figure
-        objlist = []
-        for obj in objects:
-            objlist.append(obj.properties)
-
-        export["objects"] = objlist
+        export = {
+            #Global properties passed from figure
+            "properties" : props,
+            #View properties passed from figure
+            "views"      : [props], #[viewprops]
+            #Objects passed from figure
+            "objects"    : [obj.properties for obj in objects]
+        }
         #TODO: ColourMap properties
 
-        return json.dumps(export, indent=2)
+        #Compact encoding, state is only read back by LavaVu
+        return json.dumps(export, separators=(',', ':'))
 
     def _read_state(self):
         #Read state from database (DEPRECATED)
@@ -297,6 +305,7 @@ class Store(_stgermain.StgCompoundComponent):
         """    Empties all the cached drawing objects
         """
         self._objects = []
+        self._object_ids = set()
 
 class Figure(dict):
     """  
@@ -368,6 +377,7 @@ class Figure(dict):
 
     """
     _viewerProc = None
+    _cmdConn = None
     _id = 1
 
     def __init__(self, store=None, name=None, figsize=None, boundingBox=None, facecolour="white",
@@ -415,7 +425,6 @@ class Figure(dict):
 
         #User-defined props in kwargs
         self.update(kwargs)
-        dict((k.lower(), v) for k, v in self.iteritems())
 
         if boundingBox:
             #Add 3rd dimension if missing
@@ -430,11 +439,12 @@ class Figure(dict):
         elif figsize:
             self["resolution"] = figsize
         
-        self.draw = objects.Drawing()
+        self._draw = None
         self._drawingObjects = []
         self._script = []
 
         #Types of all Drawing derived classes
+        #(found per figure so subclasses defined after the first figure are included)
         def all_subclasses(cls):
             return cls.__subclasses__() + [g for s in cls.__subclasses__() for g in all_subclasses(s)]
 
@@ -462,7 +472,7 @@ class Figure(dict):
 
     def _getProperties(self):
         #Convert properties to string
-        return '\n'.join(['%s=%s' % (k,v) for k,v in self.iteritems()]);
+        return '\n'.join('%s=%s' % kv for kv in self.iteritems())
 
     def _setProperties(self, newProps):
         #Update the properties values (merge)
@@ -505,6 +515,15 @@ class Figure(dict):
         """
         return self._drawingObjects
 
+    @property
+    def draw(self):
+        """    draw : default drawing object for direct drawing on the figure
+        (created on first use).
+        """
+        if self._draw is None:
+            self._draw = objects.Drawing()
+        return self._draw
+
     @property
     def properties(self):
         """    
@@ -687,8 +706,8 @@ class Figure(dict):
     def _generate_DB(self):
         objects = self._drawingObjects[:]
         #Only add default object if used
-        if len(self.draw.vertices) > 0:
-            objects.append(self.draw)
+        if self._draw and len(self._draw.vertices) > 0:
+            objects.append(self._draw)
         self.db._generate(self.name, objects, self)
 
     def _generate_image(self, filename="", size=(0,0)):
@@ -764,19 +783,24 @@ class Figure(dict):
     def open_viewer(self, args=[], background=True):
         """ Open the external viewer.
         """
+        #Already open?
+        if self._viewerProc and self._viewerProc.poll() == None:
+            return
+
         fname = self.db.filename
         if not fname:
             fname = os.path.join(tmpdir,"gluciferDB"+self.db._id+".gldb")
             self.save_database(fname)
-        #Already open?
-        if self._viewerProc and self._viewerProc.poll() == None:
-            return
 
         if uw.rank() == 0:
             #Open viewer with local web server for interactive/iterative use
             if background:
-                self._viewerProc = subprocess.Popen(["LV", "-" + str(self.db.step), "-p9999", "-q90", fname] + self._script + args,
-                                                    stdout=PIPE, stdin=PIPE, stderr=STDOUT)
+                import subprocess
+                #Viewer output is never read, discard it rather than letting a pipe fill up and block
+                #(stdin is left as a pipe so the viewer never sees end of input)
+                with open(os.devnull, 'wb') as devnull:
+                    self._viewerProc = subprocess.Popen(["LV", "-" + str(self.db.step), "-p9999", "-q90", fname] + self._script + args,
+                                                        stdout=devnull, stdin=subprocess.PIPE, stderr=devnull)
                 from IPython.display import HTML
                 return HTML('''<a href='#' onclick='window.open("http://" + location.hostname + ":9999");'>Open Viewer Interface</a>''')
             else:
@@ -790,6 +814,9 @@ class Figure(dict):
            self.send_command("quit")
            self._viewerProc.kill()
         self._viewerProc = None
+        if self._cmdConn:
+            self._cmdConn.close()
+        self._cmdConn = None
 
     def send_command(self, cmd, retry=True):
         """ 
@@ -801,17 +828,27 @@ class Figure(dict):
             Command to send to open viewer.
         """
         if uw.rank() == 0:
+            import urllib2
+            import httplib
             self.open_viewer()
-            url = "http://localhost:9999/command=" + urllib2.quote(cmd)
+            url = "/command=" + urllib2.quote(cmd)
             try:
-                #print url
-                response = urllib2.urlopen(url).read()
+                #Re-use a single connection to the viewer's web server
+                if not self._cmdConn:
+                    self._cmdConn = httplib.HTTPConnection("localhost", 9999)
+                self._cmdConn.request("GET", url)
+                response = self._cmdConn.getresponse().read()
                 #print response
             except:
+                #Drop the connection, a new one is opened on the next attempt
+                if self._cmdConn:
+                    self._cmdConn.close()
+                self._cmdConn = None
                 print("Send command '" + cmd + "' failed, no response")
                 if retry:
                     #Wait a few seconds so server has time to start then try again
                     print("... retrying in 1s ...")
+                    import time
                     time.sleep(1)
                     self.send_command(cmd, False)
                 else:
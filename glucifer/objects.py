@@ -57,9 +57,8 @@ class ColourMap(_stgermain.StgCompoundComponent):
 
         #User-defined props in kwargs
         self.properties.update(kwargs)
-        dict((k.lower(), v) for k, v in self.properties.iteritems())
 
-        if valueRange != None:
+        if valueRange is not None:
             # is valueRange correctly defined, ie list of length 2 made of numbers
             if not isinstance( valueRange, (list,tuple)):
                 raise TypeError("'valueRange' must be of type 'list' or 'tuple'")
@@ -105,7 +104,7 @@ class ColourMap(_stgermain.StgCompoundComponent):
 
     def _getProperties(self):
         #Convert properties to string
-        return '\n'.join(['%s=%s' % (k,v) for k,v in self.properties.iteritems()]);
+        return '\n'.join('%s=%s' % kv for kv in self.properties.iteritems())
 
 class Drawing(_stgermain.StgCompoundComponent):
     """
@@ -162,7 +161,6 @@ class Drawing(_stgermain.StgCompoundComponent):
 
         #User-defined props in kwargs
         self.properties.update(kwargs)
-        dict((k.lower(), v) for k, v in self.properties.iteritems())
 
         if not isinstance(colourBar, bool):
             raise TypeError("'colourBar' parameter must be of 'bool' type.")
@@ -185,10 +183,8 @@ class Drawing(_stgermain.StgCompoundComponent):
         super(Drawing,self)._add_to_stg_dict(componentDictionary)
 
         # add an empty(ish) drawing object.  children should fill it out.
-        componentDictionary[self._dr.name].update( {
-            "properties"    :self._getProperties(),
-            "ColourMap"     :self._colourMap._cm.name if self._colourMap else None
-        } )
+        componentDictionary[self._dr.name]["properties"] = self._getProperties()
+        componentDictionary[self._dr.name][ "ColourMap"] = self._colourMap._cm.name if self._colourMap else None
 
     #dict methods
     def update(self, newdict):
@@ -202,7 +198,7 @@ class Drawing(_stgermain.StgCompoundComponent):
 
     def _getProperties(self):
         #Convert properties to string
-        return '\n'.join(['%s=%s' % (k,v) for k,v in self.properties.iteritems()]);
+        return '\n'.join('%s=%s' % kv for kv in self.properties.iteritems())
 
     def render(self, viewer):
         #Place any custom geometry output in this method, called after database creation
@@ -428,13 +424,11 @@ class CrossSection(Drawing):
         # call parents method
         super(CrossSection,self)._add_to_stg_dict(componentDictionary)
 
-        componentDictionary[self._dr.name].update( {
-                   "Mesh": self._mesh._cself.name,
-                   "crossSection": self._crossSection,
-                   "resolutionA" : self._resolution[0],
-                   "resolutionB" : self._resolution[1],
-                   "onMesh" : self._onMesh
-            } )
+        componentDictionary[self._dr.name][        "Mesh"] = self._mesh._cself.name
+        componentDictionary[self._dr.name]["crossSection"] = self._crossSection
+        componentDictionary[self._dr.name][ "resolutionA"] = self._resolution[0]
+        componentDictionary[self._dr.name][ "resolutionB"] = self._resolution[1]
+        componentDictionary[self._dr.name][      "onMesh"] = self._onMesh
 
     @property
     def crossSection(self):
@@ -474,11 +468,10 @@ class Surface(CrossSection):
         # build parent
         super(Surface,self).__init__( mesh=mesh, fn=fn, colourBar=colourBar, onMesh=onMesh, *args, **kwargs )
 
-        #Merge with default properties
+        #Merge with default properties (user set values take precedence)
         is3d = len(self._crossSection) == 0
-        defaults = {"cullface" : is3d, "lit" : is3d}
-        defaults.update(self.properties)
-        self.properties = defaults
+        self.properties.setdefault("cullface", is3d)
+        self.properties.setdefault("lit", is3d)
 
     def _add_to_stg_dict(self,componentDictionary):
         # lets build up component dictionary
@@ -608,15 +601,15 @@ class Points(Drawing):
         self._swarm = swarm
 
         self._fn_colour = None
-        if fn_colour != None:
+        if fn_colour is not None:
            self._fn_colour = _underworld.function.Function.convert(fn_colour)
         else:
            colourBar = False
         self._fn_mask = None
-        if fn_mask != None:
+        if fn_mask is not None:
            self._fn_mask = _underworld.function.Function.convert(fn_mask)
         self._fn_size = None
-        if fn_size != None:
+        if fn_size is not None:
            self._fn_size = _underworld.function.Function.convert(fn_size)
 
         # build parent
@@ -664,11 +657,9 @@ class _GridSampler3D(CrossSection):
         # call parents method
         super(_GridSampler3D,self)._add_to_stg_dict(componentDictionary)
 
-        componentDictionary[self._dr.name].update( {
-            "resolutionX": self._resolution[0],
-            "resolutionY": self._resolution[1],
-            "resolutionZ": self._resolution[2]
-            } )
+        componentDictionary[self._dr.name]["resolutionX"] = self._resolution[0]
+        componentDictionary[self._dr.name]["resolutionY"] = self._resolution[1]
+        componentDictionary[self._dr.name]["resolutionZ"] = self._resolution[2]
 
 
 class VectorArrows(_GridSampler3D):
@@ -716,9 +707,7 @@ class VectorArrows(_GridSampler3D):
         # call parents method
         super(VectorArrows,self)._add_to_stg_dict(componentDictionary)
 
-        componentDictionary[self._dr.name].update( {
-            "dynamicRange": self._autoscale
-            } )
+        componentDictionary[self._dr.name]["dynamicRange"] = self._autoscale
 
 class Volume(_GridSampler3D):
     """  
@@ -782,7 +771,7 @@ class Sampler(Drawing):
         self._mesh = mesh
 
         self._fn = None
-        if fn != None:
+        if fn is not None:
            self._fn = _underworld.function.Function.convert(fn)
 
         # build parent
@@ -848,7 +837,7 @@ class IsoSurface(Volume):
             kwargs["isovalues"] = [isovalue]
 
         self._sampler = None
-        if fn_colour != None:
+        if fn_colour is not None:
            self._sampler = Sampler(mesh, fn_colour)
 
         super(IsoSurface,self).__init__( mesh=mesh, fn=fn, resolution=resolution,
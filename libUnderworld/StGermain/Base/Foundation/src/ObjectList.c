@@ -238,6 +238,31 @@ Index Stg_ObjectList_Append( void* objectList, void* objectPtr ) {
    return self->_append( self, objectPtr );
 }   
 
+void Stg_ObjectList_AppendArray( void* objectList, void** objectPtrs, Index count ) {
+   Stg_ObjectList* self = (Stg_ObjectList*) objectList;
+   Index           object_I;
+
+   /* Lists with their own append or allocation implementation must go through it for each object */
+   if ( self->_append != _Stg_ObjectList_Append || self->_allocMoreMemory != _Stg_ObjectList_AllocMoreMemory ) {
+      for ( object_I = 0; object_I < count; object_I++ )
+         self->_append( self, objectPtrs[object_I] );
+      return;
+   }
+
+   /* Reserve space for all the new entries at once */
+   assert( self->count <= self->_size );
+   if ( self->count + count > self->_size ) {
+      self->_size = self->count + count + self->_delta;
+      self->data = Memory_Realloc_Array( self->data, Stg_ObjectPtr, self->_size );
+      assert( self->data );
+   }
+
+   for ( object_I = 0; object_I < count; object_I++ ) {
+      assert( objectPtrs[object_I] );
+      self->data[self->count++] = (Stg_Object*) objectPtrs[object_I];
+   }
+}
+
 Index Stg_ObjectList_ClassAppend( void* objectList, void* objectPtr, Name name ) {
    Stg_ObjectList* self = (Stg_ObjectList*) objectList;
    
@@ -142,6 +142,9 @@
    /** Append Object instance to list. Returns the index where the new object was inserted (the last element) */
    Index Stg_ObjectList_Append( void* objectList, void* objectPtr );
    
+   /** Append an array of Object instances to list. Space for all of them is reserved in one allocation. */
+   void Stg_ObjectList_AppendArray( void* objectList, void** objectPtrs, Index count );
+   
    /** Append Stg_Class instance to list. Returns the index where the new object was inserted (the last element) */
    Index Stg_ObjectList_ClassAppend( void* objectList, void* objectPtr, Name name );
    
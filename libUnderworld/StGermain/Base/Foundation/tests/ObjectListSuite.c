@@ -12,6 +12,8 @@
 #include "StGermain/Base/Foundation/forwardDecl.h"
 #include "ObjectListSuite.h"
 
+#define APPEND_ARRAY_COUNT 12
+
 const Type DummyClass_Type = "DummyClass_Type";
 
 typedef struct {
@@ -110,6 +112,33 @@ void ObjectListSuite_TestAppend( ObjectListSuiteData* data ) {
       Stg_ObjectList_Count( data->ol3 ) == 1 );
 }
 
+/* Test 2b: Can we append an array of entries at once, growing the list past its initial size? */
+void ObjectListSuite_TestAppendArray( ObjectListSuiteData* data ) {
+   void*    dummies[APPEND_ARRAY_COUNT];
+   void*    objects[APPEND_ARRAY_COUNT];
+   char     name[16];
+   Index    object_I;
+
+   /* More entries than the default initial size, so the list must grow */
+   pcu_check_true( APPEND_ARRAY_COUNT > DEFAULT_LIST_INITIAL_SIZE );
+
+   Stg_ObjectList_ClassAppend( data->ol0, (data->addPtr0 = DummyClass_New()), (Name)"a"  );
+   for ( object_I = 0; object_I < APPEND_ARRAY_COUNT; object_I++ ) {
+      sprintf( name, "b%u", object_I );
+      dummies[object_I] = DummyClass_New();
+      objects[object_I] = Stg_ObjectAdaptor_NewOfClass( dummies[object_I], (Name)name, True, False );
+   }
+   Stg_ObjectList_AppendArray( data->ol0, objects, APPEND_ARRAY_COUNT );
+
+   pcu_check_true( Stg_ObjectList_Count( data->ol0 ) == APPEND_ARRAY_COUNT + 1 );
+   pcu_check_true( data->addPtr0 == Stg_ObjectList_ObjectAt( data->ol0, 0 ) );
+   for ( object_I = 0; object_I < APPEND_ARRAY_COUNT; object_I++ ) {
+      sprintf( name, "b%u", object_I );
+      pcu_check_true( dummies[object_I] == Stg_ObjectList_ObjectAt( data->ol0, object_I + 1 ) );
+      pcu_check_true( Stg_ObjectList_GetIndex( data->ol0, (Name)name ) == object_I + 1 );
+   }
+}
+
 /* Test 3: Can we prepend the second entry? */
 void ObjectListSuite_TestPrepend( ObjectListSuiteData* data ) {
    Stg_ObjectList_ClassAppend( data->ol0, (data->addPtr0 = DummyClass_New()), (Name)"a"  );
@@ -445,6 +474,7 @@ void ObjectListSuite( pcu_suite_t* suite ) {
    pcu_suite_setData( suite, ObjectListSuiteData );
    pcu_suite_setFixtures( suite, ObjectListSuite_Setup, ObjectListSuite_Teardown );
    pcu_suite_addTest( suite, ObjectListSuite_TestAppend );
+   pcu_suite_addTest( suite, ObjectListSuite_TestAppendArray );
    pcu_suite_addTest( suite, ObjectListSuite_TestPrepend );
    pcu_suite_addTest( suite, ObjectListSuite_TestInsertBefore );
    pcu_suite_addTest( suite, ObjectListSuite_TestInsertAfter );
@@ -286,8 +286,13 @@ void _lucDatabase_Execute( void* database, void* data )
 
       /* Do each timestep database output in a single transaction 
        * (defaults to on, fastest option but possibly will require more memory) */
-      if (!self->splitTransactions)
-         Journal_Firewall(lucDatabase_BeginTransaction(self), lucError, "Begin transaction failed! %s '%s'.\n", self->type, self->name );
+      if (!self->splitTransactions && !lucDatabase_BeginTransaction(self))
+      {
+         /* Database locked (eg: by a viewer), fall back to per-object transactions
+          * so objects that can't be written are skipped rather than aborting */
+         Journal_Printf(lucError, "Begin transaction failed! %s '%s', using per-object transactions.\n", self->type, self->name );
+         self->splitTransactions = True;
+      }
 
       /* If a data window is set, delete expired geometry */
       if (self->deleteAfter > 0 )
@@ -79,3 +79,38 @@
 }
 
 
+/* Python sequence of wrapped objects -> (void** objectPtrs, Index count), used by Stg_ObjectList_AppendArray */
+%typemap(in) (void** objectPtrs, Index count) {
+   if (!PySequence_Check($input)) {
+      PyErr_SetString(PyExc_TypeError, "Expecting a sequence of objects");
+      SWIG_fail;
+   }
+   Py_ssize_t len = PySequence_Length($input);
+   if (len < 0) SWIG_fail; /* Python error already set */
+   $2 = (Index)len;
+   $1 = (void**)malloc(sizeof(void*) * ($2 > 0 ? $2 : 1));
+   if (!$1) {
+      PyErr_NoMemory();
+      SWIG_fail;
+   }
+   for (Index i = 0; i < $2; i++) {
+      PyObject* item = PySequence_GetItem($input, i);
+      if (!item) {
+         /* Python error already set */
+         free($1);
+         $1 = NULL;
+         SWIG_fail;
+      }
+      int res = SWIG_ConvertPtr(item, &$1[i], 0, 0);
+      Py_DECREF(item);
+      if (!SWIG_IsOK(res) || !$1[i]) {
+         free($1);
+         $1 = NULL;
+         SWIG_exception_fail(SWIG_TypeError, "Sequence items must be non-null wrapped objects");
+      }
+   }
+}
+
+%typemap(freearg) (void** objectPtrs, Index count) {
+   if ($1) free($1);
+}